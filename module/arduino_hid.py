@@ -1,9 +1,93 @@
+import os
+import sys
 import serial
 import serial.tools.list_ports
 import struct
 import time
 from typing import Optional, List, Tuple
-from module.com_port_detector import PortDetector as pd
+from module.com.port_detector import PortDetector as pd
+from module.crc8_native import crc8_maxim as _crc8_c  # None = 共享庫沒編譯
+
+# CRC-8/MAXIM lookup table
+# 存成不可變 bytes 常數: 密集的 256 B (list[int] 版本每個 entry 是帶
+# PyObject header 的 boxed int，整張表 ~7 KB、散在 heap 上)，
+# 索引直接回傳 int，也省查找
+_CRC8_TABLE = bytes([
+    0x00, 0x5E, 0xBC, 0xE2, 0x61, 0x3F, 0xDD, 0x83,
+    0xC2, 0x9C, 0x7E, 0x20, 0xA3, 0xFD, 0x1F, 0x41,
+    0x9D, 0xC3, 0x21, 0x7F, 0xFC, 0xA2, 0x40, 0x1E,
+    0x5F, 0x01, 0xE3, 0xBD, 0x3E, 0x60, 0x82, 0xDC,
+    0x23, 0x7D, 0x9F, 0xC1, 0x42, 0x1C, 0xFE, 0xA0,
+    0xE1, 0xBF, 0x5D, 0x03, 0x80, 0xDE, 0x3C, 0x62,
+    0xBE, 0xE0, 0x02, 0x5C, 0xDF, 0x81, 0x63, 0x3D,
+    0x7C, 0x22, 0xC0, 0x9E, 0x1D, 0x43, 0xA1, 0xFF,
+    0x46, 0x18, 0xFA, 0xA4, 0x27, 0x79, 0x9B, 0xC5,
+    0x84, 0xDA, 0x38, 0x66, 0xE5, 0xBB, 0x59, 0x07,
+    0xDB, 0x85, 0x67, 0x39, 0xBA, 0xE4, 0x06, 0x58,
+    0x19, 0x47, 0xA5, 0xFB, 0x78, 0x26, 0xC4, 0x9A,
+    0x65, 0x3B, 0xD9, 0x87, 0x04, 0x5A, 0xB8, 0xE6,
+    0xA7, 0xF9, 0x1B, 0x45, 0xC6, 0x98, 0x7A, 0x24,
+    0xF8, 0xA6, 0x44, 0x1A, 0x99, 0xC7, 0x25, 0x7B,
+    0x3A, 0x64, 0x86, 0xD8, 0x5B, 0x05, 0xE7, 0xB9,
+    0x8C, 0xD2, 0x30, 0x6E, 0xED, 0xB3, 0x51, 0x0F,
+    0x4E, 0x10, 0xF2, 0xAC, 0x2F, 0x71, 0x93, 0xCD,
+    0x11, 0x4F, 0xAD, 0xF3, 0x70, 0x2E, 0xCC, 0x92,
+    0xD3, 0x8D, 0x6F, 0x31, 0xB2, 0xEC, 0x0E, 0x50,
+    0xAF, 0xF1, 0x13, 0x4D, 0xCE, 0x90, 0x72, 0x2C,
+    0x6D, 0x33, 0xD1, 0x8F, 0x0C, 0x52, 0xB0, 0xEE,
+    0x32, 0x6C, 0x8E, 0xD0, 0x53, 0x0D, 0xEF, 0xB1,
+    0xF0, 0xAE, 0x4C, 0x12, 0x91, 0xCF, 0x2D, 0x73,
+    0xCA, 0x94, 0x76, 0x28, 0xAB, 0xF5, 0x17, 0x49,
+    0x08, 0x56, 0xB4, 0xEA, 0x69, 0x37, 0xD5, 0x8B,
+    0x57, 0x09, 0xEB, 0xB5, 0x36, 0x68, 0x8A, 0xD4,
+    0x95, 0xCB, 0x29, 0x77, 0xF4, 0xAA, 0x48, 0x16,
+    0xE9, 0xB7, 0x55, 0x0B, 0x88, 0xD6, 0x34, 0x6A,
+    0x2B, 0x75, 0x97, 0xC9, 0x4A, 0x14, 0xF6, 0xA8,
+    0x74, 0x2A, 0xC8, 0x96, 0x15, 0x4B, 0xA9, 0xF7,
+    0xB6, 0xE8, 0x0A, 0x54, 0xD7, 0x89, 0x6B, 0x35
+])
+
+
+# 單一 byte 參數用切片拿，不走 bytes([x]) 的「建 list 再轉」路徑
+# (模組層級常數切 1 byte 會命中 CPython 的小 bytes 快取，零配置)
+_SINGLE_BYTE = bytes(range(256))
+
+
+def _one_byte(value: int) -> bytes:
+    """
+    value 轉單一 byte 參數
+
+    範圍要先驗: 切片越界只會默默給 b''，封包就少了參數，
+    錯誤會變成韌體那邊看不懂的 PARAM_ERROR (bytes([x]) 本來會丟 ValueError)。
+    """
+    if 0 <= value <= 255:
+        return _SINGLE_BYTE[value:value + 1]
+    raise ValueError(f"bytes must be in range(0, 256): {value}")
+
+
+# 預編譯的參數封包格式 (struct.pack 每次呼叫都會重新解析格式字串)
+_MOUSE_MOVE_FMT = struct.Struct('bbb')
+_PRESS_TIMED_FMT = struct.Struct('>BH')
+
+# 選配: Numba JIT 的 CRC kernel
+# 有裝 numba 時長 payload 的 Sarwate 迴圈跑編譯碼，短封包仍走純 Python (呼叫開銷划不來)
+try:
+    import numpy as _np
+    from numba import njit as _njit
+
+    _CRC8_TABLE_NP = _np.frombuffer(_CRC8_TABLE, dtype=_np.uint8)
+
+    @_njit(cache=True)
+    def _crc8_nb(buf, table):  # pragma: no cover - 需要 numba
+        crc = 0
+        for i in range(buf.shape[0]):
+            crc = table[crc ^ buf[i]]
+        return crc
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 
 class ArduinoHIDException(Exception):
     """Arduino HID 異常"""
@@ -78,41 +162,8 @@ class ArduinoHID:
     KEY_F11 = 0xCC
     KEY_F12 = 0xCD
 
-    # CRC-8/MAXIM lookup table
-    CRC8_TABLE = [
-        0x00, 0x5E, 0xBC, 0xE2, 0x61, 0x3F, 0xDD, 0x83,
-        0xC2, 0x9C, 0x7E, 0x20, 0xA3, 0xFD, 0x1F, 0x41,
-        0x9D, 0xC3, 0x21, 0x7F, 0xFC, 0xA2, 0x40, 0x1E,
-        0x5F, 0x01, 0xE3, 0xBD, 0x3E, 0x60, 0x82, 0xDC,
-        0x23, 0x7D, 0x9F, 0xC1, 0x42, 0x1C, 0xFE, 0xA0,
-        0xE1, 0xBF, 0x5D, 0x03, 0x80, 0xDE, 0x3C, 0x62,
-        0xBE, 0xE0, 0x02, 0x5C, 0xDF, 0x81, 0x63, 0x3D,
-        0x7C, 0x22, 0xC0, 0x9E, 0x1D, 0x43, 0xA1, 0xFF,
-        0x46, 0x18, 0xFA, 0xA4, 0x27, 0x79, 0x9B, 0xC5,
-        0x84, 0xDA, 0x38, 0x66, 0xE5, 0xBB, 0x59, 0x07,
-        0xDB, 0x85, 0x67, 0x39, 0xBA, 0xE4, 0x06, 0x58,
-        0x19, 0x47, 0xA5, 0xFB, 0x78, 0x26, 0xC4, 0x9A,
-        0x65, 0x3B, 0xD9, 0x87, 0x04, 0x5A, 0xB8, 0xE6,
-        0xA7, 0xF9, 0x1B, 0x45, 0xC6, 0x98, 0x7A, 0x24,
-        0xF8, 0xA6, 0x44, 0x1A, 0x99, 0xC7, 0x25, 0x7B,
-        0x3A, 0x64, 0x86, 0xD8, 0x5B, 0x05, 0xE7, 0xB9,
-        0x8C, 0xD2, 0x30, 0x6E, 0xED, 0xB3, 0x51, 0x0F,
-        0x4E, 0x10, 0xF2, 0xAC, 0x2F, 0x71, 0x93, 0xCD,
-        0x11, 0x4F, 0xAD, 0xF3, 0x70, 0x2E, 0xCC, 0x92,
-        0xD3, 0x8D, 0x6F, 0x31, 0xB2, 0xEC, 0x0E, 0x50,
-        0xAF, 0xF1, 0x13, 0x4D, 0xCE, 0x90, 0x72, 0x2C,
-        0x6D, 0x33, 0xD1, 0x8F, 0x0C, 0x52, 0xB0, 0xEE,
-        0x32, 0x6C, 0x8E, 0xD0, 0x53, 0x0D, 0xEF, 0xB1,
-        0xF0, 0xAE, 0x4C, 0x12, 0x91, 0xCF, 0x2D, 0x73,
-        0xCA, 0x94, 0x76, 0x28, 0xAB, 0xF5, 0x17, 0x49,
-        0x08, 0x56, 0xB4, 0xEA, 0x69, 0x37, 0xD5, 0x8B,
-        0x57, 0x09, 0xEB, 0xB5, 0x36, 0x68, 0x8A, 0xD4,
-        0x95, 0xCB, 0x29, 0x77, 0xF4, 0xAA, 0x48, 0x16,
-        0xE9, 0xB7, 0x55, 0x0B, 0x88, 0xD6, 0x34, 0x6A,
-        0x2B, 0x75, 0x97, 0xC9, 0x4A, 0x14, 0xF6, 0xA8,
-        0x74, 0x2A, 0xC8, 0x96, 0x15, 0x4B, 0xA9, 0xF7,
-        0xB6, 0xE8, 0x0A, 0x54, 0xD7, 0x89, 0x6B, 0x35
-    ]
+    # CRC-8/MAXIM lookup table (見模組層級 _CRC8_TABLE)
+    CRC8_TABLE = _CRC8_TABLE
 
     def __init__(self, port: Optional[str] = None, baudrate: int = 115200,
                  timeout: float = 0.1, retries: int = 3, debug=False, auto_detect: bool = True):
@@ -128,6 +179,20 @@ class ArduinoHID:
         """
         self.interrupted = False  # 中斷旗標
 
+        # CRC 實作: fastcrc (C 加速) > 自家 slice-by-4 C 庫 > numba JIT > 純 Python 查表
+        try:
+            from fastcrc import crc8 as _fastcrc8
+            # fastcrc 只吃 bytes，memoryview 進來要先轉
+            # (AttributeError 也要接: 裝到沒有 maxim_dow 的版本時走 fallback)
+            self._crc8_fn = lambda data, _f=_fastcrc8.maxim_dow: _f(bytes(data))
+        except (ImportError, AttributeError):
+            if _crc8_c is not None:
+                self._crc8_fn = self._crc8_cext
+            elif _HAS_NUMBA:
+                self._crc8_fn = self._crc8_numba
+            else:
+                self._crc8_fn = self._crc8_py
+
         port = pd.find_arduino()
 
         if port is None:
@@ -143,33 +208,220 @@ class ArduinoHID:
             self.ser = serial.Serial(port, baudrate, timeout=timeout)
             self.retries = retries
             print(f"✓ 已連接到: {port} @ {baudrate} bps")
-            time.sleep(2)  # 等待 Arduino 初始化
+            self._wait_for_ready()  # 等待 Arduino 初始化 (ping 輪詢，最多 2 秒)
 
             # 清空接收緩衝區
             self.ser.reset_input_buffer()
             self.ser.reset_output_buffer()
 
+            # 壓低 USB-serial 驅動的 latency timer (預設 16 ms，等 ACK 很傷)
+            self._tune_latency()
+
+            # 熱路徑用的 bound method 快取 (省掉每個封包兩次屬性查找)
+            # 注意: 若日後加入重連機制，重開 port 後要重新綁定
+            self._write = self.ser.write
+            self._read = self.ser.read
+
+            # _send_packet 重複使用的封包緩衝 (最大封包 ~34 byte，64 綽綽有餘)
+            # 穩態下熱路徑零配置
+            self._pktbuf = bytearray(64)
+            self._pktmv = memoryview(self._pktbuf)
+
+            # mouse_move_stream 尚未回收的 ACK 數
+            self._stream_pending = 0
+
         except serial.SerialException as e:
+            pd.invalidate_cache()  # 開不起來的 port 不能留在快取
             raise ArduinoHIDException(f"無法開啟 {port}: {e}")
 
-    def _crc8(self, data: bytes) -> int:
-        """計算 CRC-8/MAXIM"""
+    def _wait_for_ready(self, max_wait: float = 2.0) -> None:
+        """
+        等韌體就緒 (sleep → event 的替換)
+
+        原本固定 time.sleep(2)，短腳本的啟動時間全被它吃掉。
+        改成用無副作用的輕量 ping (CMD_KB_RELEASE_ALL) 以 50 ms 週期輪詢，
+        收到第一個 ACK_SUCCESS 就視為就緒 — 板子早就開好時 <50 ms 可以回來。
+        max_wait 內都沒有合法回應就等滿它，行為等同原本的固定 sleep。
+        """
+        old_timeout = self.ser.timeout
+        self.ser.timeout = 0.05
+        try:
+            ping = self._build_packet(self.CMD_KB_RELEASE_ALL)
+            deadline = time.monotonic() + max_wait
+            while time.monotonic() < deadline:
+                try:
+                    self.ser.reset_input_buffer()  # 丟掉開機訊息之類的雜訊
+                    self.ser.write(ping)
+                    ack = self.ser.read(1)
+                except serial.SerialException:
+                    break
+                if ack and ack[0] == self.ACK_SUCCESS:
+                    return
+                time.sleep(0.05)
+        finally:
+            self.ser.timeout = old_timeout
+            self.ser.reset_input_buffer()
+
+    def _tune_latency(self):
+        """
+        盡量把 USB-serial 驅動的 latency timer 設成 1 ms
+
+        FTDI/CDC 預設 16 ms 才 flush 一次，每個 ACK 都要等它。
+        設定失敗 (權限不足、非 FTDI 裝置...) 不影響功能，純粹 best-effort。
+        """
+        try:
+            if sys.platform.startswith('linux'):
+                tty = os.path.basename(self.ser.port or '')
+                latency_path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+                if os.path.exists(latency_path):
+                    with open(latency_path, 'w') as f:
+                        f.write('1')
+                    print(f"✓ latency_timer -> 1 ms ({tty})")
+            elif sys.platform == 'win32':
+                try:
+                    import ftd2xx
+                    dev = ftd2xx.open(0)
+                    dev.setLatencyTimer(1)
+                    dev.close()
+                    print("✓ FTDI latency timer -> 1 ms")
+                except ImportError:
+                    # 沒有 ftd2xx 就退而求其次放大接收緩衝
+                    self.ser.set_buffer_size(rx_size=4096)
+        except Exception:
+            pass  # 調不動就算了，走預設值
+
+    def _crc8_py(self, data: bytes, _table=_CRC8_TABLE) -> int:
+        """計算 CRC-8/MAXIM，純 Python 查表版 (_table 預設參數綁定，避免每個 byte 查 self 屬性)"""
         crc = 0x00
         for byte in data:
-            crc = self.CRC8_TABLE[crc ^ byte]
+            crc = _table[crc ^ byte]
         return crc
 
+    def _crc8_cext(self, data: bytes) -> int:
+        """計算 CRC-8/MAXIM，slice-by-4 C 庫版 (只在 payload 夠長時進 C)"""
+        if len(data) < 16:
+            # 1~3 byte 的小封包直接查表還比跨 FFI 便宜
+            return self._crc8_py(data)
+        return _crc8_c(data)
+
+    def _crc8_numba(self, data: bytes) -> int:
+        """計算 CRC-8/MAXIM，Numba JIT 版 (只在 payload 夠長時進 kernel)"""
+        if len(data) < 16:
+            # 短封包的 FFI/轉換開銷蓋過收益，查表就好
+            return self._crc8_py(data)
+        return int(_crc8_nb(_np.frombuffer(data, dtype=_np.uint8), _CRC8_TABLE_NP))
+
+    def _crc8(self, data: bytes) -> int:
+        """計算 CRC-8/MAXIM (依安裝環境分派到 fastcrc / numba / 純 Python 版)"""
+        return self._crc8_fn(data)
+
+    def _build_packet(self, cmd: int, params: bytes = b'') -> bytearray:
+        """組出完整封包: SYNC | LEN | CMD | params... | CRC"""
+        # 一次配置好整個封包
+        # (避免 bytes([x]) + 串接造成每次發送 4 個小物件配置)
+        n = 4 + len(params)
+        packet = bytearray(n)
+        packet[0] = self.SYNC_BYTE
+        packet[1] = 1 + len(params)
+        packet[2] = cmd
+        packet[3:n - 1] = params
+        packet[n - 1] = self._crc8(memoryview(packet)[2:n - 1])
+        return packet
+
+    def _check_ack(self, ack_code: int, cmd: int) -> bool:
+        """檢查單一 ACK byte，成功回 True、CRC 錯回 False (可重試)、其餘拋例外"""
+        if ack_code == self.ACK_SUCCESS:
+            return True
+        elif ack_code == self.ACK_INTERRUPTED:
+            self.interrupted = True
+            raise ArduinoHIDException("⚠️ 指令被硬體按鈕中斷!")
+        elif ack_code == self.ACK_CRC_ERROR:
+            return False
+        elif ack_code == self.ACK_INVALID_CMD:
+            raise ArduinoHIDException(f"Invalid command: 0x{cmd:02X}")
+        elif ack_code == self.ACK_PARAM_ERROR:
+            raise ArduinoHIDException(f"Parameter error for command: 0x{cmd:02X}")
+        else:
+            raise ArduinoHIDException(f"Unknown ACK code: 0x{ack_code:02X}")
+
+    def _read_exact(self, n: int) -> bytes:
+        """
+        讀滿 n 個 byte
+
+        緩衝區已經有資料時先一口氣 drain (一次 syscall)，
+        不足的部分才走阻塞 read 等 driver，
+        避免逐 byte read(1) 每次都吃一個 USB polling 週期。
+        """
+        waiting = self.ser.in_waiting
+        if waiting >= n:
+            return self._read(n)
+        buf = self._read(waiting) if waiting else b''
+        if len(buf) < n:
+            buf += self._read(n - len(buf))
+        return buf
+
+    def _drain_stream_acks(self) -> None:
+        """
+        把 mouse_move_stream 欠收的 ACK 收乾淨
+
+        不清的話下一個要驗證的指令會把殘留的串流 ACK 當成自己的回應，
+        之後指令/ACK 的配對就永遠錯位。有看到 ACK_INTERRUPTED 一樣設旗標。
+        """
+        if self._stream_pending <= 0:
+            return
+        acks = self._read_exact(self._stream_pending)
+        if _SINGLE_BYTE[self.ACK_INTERRUPTED:self.ACK_INTERRUPTED + 1] in acks:
+            self.interrupted = True
+        # 逾時沒收滿就當掉線上掉了，歸零重新配對
+        self._stream_pending = 0
+
+    def _send_packets_pipelined(self, packets: List[bytes], depth: int = 4) -> bool:
+        """
+        管線化發送: 一次寫出多個封包後再一起收 ACK
+
+        Arduino 端處理與 ACK 回傳跟下一筆 write 重疊，
+        USB CDC 的來回延遲只付一次/批而不是一次/封包。
+
+        Args:
+            packets: 已由 _build_packet 組好的封包列表
+            depth: 同時在線上的封包數上限 (太深會塞爆韌體的接收緩衝)
+        """
+        self._drain_stream_acks()  # 先把串流模式欠的 ACK 清掉再配對
+        for i in range(0, len(packets), depth):
+            batch = packets[i:i + depth]
+            try:
+                self._write(b''.join(batch))
+                acks = self._read_exact(len(batch))
+            except serial.SerialException as e:
+                raise ArduinoHIDException(f"Serial error: {e}")
+
+            if len(acks) < len(batch):
+                raise ArduinoHIDException(
+                    f"Pipelined send: expect {len(batch)} ACK, only got {len(acks)}")
+
+            for ack_code in acks:
+                if not self._check_ack(ack_code, batch[0][2]):
+                    # 管線模式沒有逐包重試，CRC 錯就直接視為失敗
+                    raise ArduinoHIDException("CRC error (pipelined)")
+        return True
+
     def _send_packet(self, cmd: int, params: bytes = b'') -> bool:
         """發送封包並等待 ACK"""
-        data = bytes([cmd]) + params
-        data_len = len(data)
-        crc = self._crc8(data)
-        packet = bytes([self.SYNC_BYTE, data_len]) + data + bytes([crc])
+        self._drain_stream_acks()  # 先把串流模式欠的 ACK 清掉再配對
+        # 寫進重複使用的緩衝，不另外配置 (管線路徑才需要獨立封包物件)
+        n = 4 + len(params)
+        buf = self._pktbuf
+        buf[0] = self.SYNC_BYTE
+        buf[1] = 1 + len(params)
+        buf[2] = cmd
+        buf[3:n - 1] = params
+        buf[n - 1] = self._crc8(self._pktmv[2:n - 1])
+        packet = self._pktmv[:n]
 
         for attempt in range(self.retries):
             try:
-                self.ser.write(packet)
-                ack = self.ser.read(1)
+                self._write(packet)
+                ack = self._read_exact(1)
 
                 if len(ack) == 0:
                     if attempt < self.retries - 1:
@@ -177,24 +429,14 @@ class ArduinoHID:
                         continue
                     raise ArduinoHIDException("No ACK received")
 
-                ack_code = ack[0]
-
-                if ack_code == self.ACK_SUCCESS:
+                if self._check_ack(ack[0], cmd):
                     return True
-                elif ack_code == self.ACK_INTERRUPTED:
-                    self.interrupted = True
-                    raise ArduinoHIDException("⚠️ 指令被硬體按鈕中斷!")
-                elif ack_code == self.ACK_CRC_ERROR:
-                    if attempt < self.retries - 1:
-                        time.sleep(0.01)
-                        continue
-                    raise ArduinoHIDException("CRC error")
-                elif ack_code == self.ACK_INVALID_CMD:
-                    raise ArduinoHIDException(f"Invalid command: 0x{cmd:02X}")
-                elif ack_code == self.ACK_PARAM_ERROR:
-                    raise ArduinoHIDException(f"Parameter error for command: 0x{cmd:02X}")
-                else:
-                    raise ArduinoHIDException(f"Unknown ACK code: 0x{ack_code:02X}")
+
+                # CRC error: 可以重試
+                if attempt < self.retries - 1:
+                    time.sleep(0.01)
+                    continue
+                raise ArduinoHIDException("CRC error")
 
             except serial.SerialException as e:
                 raise ArduinoHIDException(f"Serial error: {e}")
@@ -227,44 +469,83 @@ class ArduinoHID:
 
     def mouse_move(self, x: int, y: int, wheel: int = 0) -> bool:
         """移動滑鼠"""
-        x = max(-127, min(127, x))
-        y = max(-127, min(127, y))
-        wheel = max(-127, min(127, wheel))
-        params = struct.pack('bbb', x, y, wheel)
+        # 條件運算式 clamp，不走 max()/min() 的 builtin 呼叫 (六次/呼叫)
+        x = -127 if x < -127 else 127 if x > 127 else x
+        y = -127 if y < -127 else 127 if y > 127 else y
+        wheel = -127 if wheel < -127 else 127 if wheel > 127 else wheel
+        params = _MOUSE_MOVE_FMT.pack(x, y, wheel)
         return self._send_packet(self.CMD_MOUSE_MOVE, params)
 
+    def mouse_move_stream(self, x: int, y: int, wheel: int = 0, drain_every: int = 32) -> None:
+        """
+        移動滑鼠 (fire-and-forget，不等 ACK)
+
+        給 100~500 Hz 的連續指標移動用: 掉一筆移動肉眼看不出來，
+        但每筆都等 ACK 會把頻率壓死。
+        每 drain_every 筆把累積的 ACK 一次清掉，避免接收緩衝被塞爆；
+        清出來若看到 ACK_INTERRUPTED 一樣會設中斷旗標。
+        """
+        x = -127 if x < -127 else 127 if x > 127 else x
+        y = -127 if y < -127 else 127 if y > 127 else y
+        wheel = -127 if wheel < -127 else 127 if wheel > 127 else wheel
+
+        buf = self._pktbuf
+        buf[0] = self.SYNC_BYTE
+        buf[1] = 4  # CMD + 3 bytes params
+        buf[2] = self.CMD_MOUSE_MOVE
+        buf[3:6] = _MOUSE_MOVE_FMT.pack(x, y, wheel)
+        buf[6] = self._crc8(self._pktmv[2:6])
+
+        try:
+            self._write(self._pktmv[:7])
+        except serial.SerialException as e:
+            raise ArduinoHIDException(f"Serial error: {e}")
+
+        self._stream_pending += 1
+        if self._stream_pending >= drain_every:
+            waiting = self.ser.in_waiting
+            if waiting:
+                acks = self._read(waiting)
+                if _SINGLE_BYTE[self.ACK_INTERRUPTED:self.ACK_INTERRUPTED + 1] in acks:
+                    self.interrupted = True
+                # 只扣真的收到的數量 — 還在線上的之後由
+                # _drain_stream_acks 補收，欠帳數字才對得起來
+                self._stream_pending -= len(acks)
+                if self._stream_pending < 0:
+                    self._stream_pending = 0
+
     def mouse_press(self, button: int = MOUSE_LEFT) -> bool:
         """按下滑鼠按鍵"""
-        return self._send_packet(self.CMD_MOUSE_PRESS, bytes([button]))
+        return self._send_packet(self.CMD_MOUSE_PRESS, _one_byte(button))
 
     def mouse_release(self, button: int = MOUSE_LEFT) -> bool:
         """釋放滑鼠按鍵"""
-        return self._send_packet(self.CMD_MOUSE_RELEASE, bytes([button]))
+        return self._send_packet(self.CMD_MOUSE_RELEASE, _one_byte(button))
 
     def mouse_click(self, button: int = MOUSE_LEFT) -> bool:
         """點擊滑鼠"""
-        return self._send_packet(self.CMD_MOUSE_CLICK, bytes([button]))
+        return self._send_packet(self.CMD_MOUSE_CLICK, _one_byte(button))
 
     def mouse_press_timed(self, button: int = MOUSE_LEFT, duration_ms: int = 200) -> bool:
         """按住滑鼠按鍵指定時間後釋放(Arduino 端控制,非阻塞)"""
         duration_ms = max(1, min(65535, duration_ms))
-        params = struct.pack('>BH', button, duration_ms)
+        params = _PRESS_TIMED_FMT.pack(button, duration_ms)
         return self._send_packet(self.CMD_MOUSE_PRESS_TIMED, params)
 
     # ========== 鍵盤方法 ==========
 
     def keyboard_press(self, key: int) -> bool:
         """按下按鍵"""
-        return self._send_packet(self.CMD_KB_PRESS, bytes([key]))
+        return self._send_packet(self.CMD_KB_PRESS, _one_byte(key))
 
     def keyboard_release(self, key: int) -> bool:
         """釋放按鍵"""
-        return self._send_packet(self.CMD_KB_RELEASE, bytes([key]))
+        return self._send_packet(self.CMD_KB_RELEASE, _one_byte(key))
 
     def keyboard_send(self, key: int, delay=0.05) -> bool:
         """按下並釋放按鍵"""
         time.sleep(delay)
-        return self._send_packet(self.CMD_KB_WRITE, bytes([key]))
+        return self._send_packet(self.CMD_KB_WRITE, _one_byte(key))
 
     def keyboard_release_all(self) -> bool:
         """釋放所有按鍵"""
@@ -273,49 +554,87 @@ class ArduinoHID:
     def keyboard_press_timed(self, key: int, duration_ms: int) -> bool:
         """按住按鍵指定時間後釋放(Arduino 端控制,非阻塞)"""
         duration_ms = max(1, min(65535, duration_ms))
-        params = struct.pack('>BH', key, duration_ms)
+        params = _PRESS_TIMED_FMT.pack(key, duration_ms)
         return self._send_packet(self.CMD_KB_PRESS_TIMED, params)
 
-    def keyboard_print(self, text: str, check_interrupt: bool = True) -> bool:
+    def keyboard_print(self, text: str, check_interrupt: bool = True, depth: int = 4) -> bool:
         """
-        輸入字串(一次性發送)
+        輸入字串(切成 30 byte chunk，管線化發送)
 
         Args:
             text: 要輸入的文字
-            check_interrupt: 是否在每個 chunk 後檢查中斷旗標
+            check_interrupt: 發送前是否檢查中斷旗標
+            depth: 管線深度 (一次在線上的封包數，見 _send_packets_pipelined)
         """
-        if len(text) > 30:
-            for i in range(0, len(text), 30):
-                if check_interrupt and self.interrupted:
-                    print("⚠️ 文字輸入被中斷")
-                    return False
-
-                chunk = text[i:i + 30]
-                if not self._send_packet(self.CMD_KB_PRINT, chunk.encode('ascii', errors='ignore')):
-                    return False
-            return True
+        if check_interrupt and self.interrupted:
+            print("⚠️ 文字輸入被中斷")
+            return False
+
+        # 整串只跑一次 codec，之後切 bytes 就只是 memcpy
+        data = text.encode('ascii', errors='ignore')
+
+        if len(data) > 30:
+            packets = [
+                self._build_packet(self.CMD_KB_PRINT, data[i:i + 30])
+                for i in range(0, len(data), 30)
+            ]
+            return self._send_packets_pipelined(packets, depth=depth)
         else:
-            return self._send_packet(self.CMD_KB_PRINT, text.encode('ascii', errors='ignore'))
+            return self._send_packet(self.CMD_KB_PRINT, data)
 
     def keyboard_type_str(self, text: str, delay: float = 0.01, check_interrupt: bool = True) -> bool:
         """
-        輸入文字(逐字元發送)
+        輸入文字(可列印 ASCII 自動批次發送)
+
+        連續的可列印字元 (32~126) 會累積成 30 byte 的 CMD_KB_PRINT 封包一次送出，
+        USB 來回次數從每字元一次降到每 30 字元一次；
+        其餘按鍵代碼才退回逐字元的 CMD_KB_WRITE。
 
         Args:
             text: 要輸入的文字
-            delay: 字元間延遲
-            check_interrupt: 是否檢查中斷旗標
+            delay: 逐字元 fallback 的字元間延遲 (批次封包不套用)
+            check_interrupt: 是否在每個封包後檢查中斷旗標
         """
+        run = []  # 累積中的可列印字元
+        next_t = time.monotonic()  # 逐字元延遲的絕對截止時間
+
+        def _flush() -> bool:
+            while run:
+                if check_interrupt and self.interrupted:
+                    print("⚠️ 打字被中斷")
+                    return False
+                chunk = ''.join(run[:30])
+                del run[:30]
+                if not self._send_packet(self.CMD_KB_PRINT, chunk.encode('ascii')):
+                    return False
+            return True
+
         for char in text:
+            if 32 <= ord(char) <= 126:
+                run.append(char)
+                continue
+
+            # 非可列印字元: 先清掉累積的批次，再逐字元送
+            if not _flush():
+                return False
             if check_interrupt and self.interrupted:
                 print("⚠️ 打字被中斷")
                 return False
-
             if not self.keyboard_send(ord(char)):
                 return False
             if delay > 0:
-                time.sleep(delay)
-        return True
+                # 排程到絕對截止時間，而不是每次睡固定 delay:
+                # time.sleep 在 Windows 會超睡 (timer 解析度 1~15 ms)，
+                # 累積誤差靠下一輪縮短睡眠吸收，整串節奏不漂移
+                next_t += delay
+                remain = next_t - time.monotonic()
+                if remain > 0:
+                    time.sleep(remain)
+
+        return _flush()
+
+    # 別名: demo 腳本用這個名字
+    keyboard_type = keyboard_type_str
 
     def keyboard_execute_sequence(self, *actions, delay: float = 0.01) -> bool:
         """
@@ -1,11 +1,41 @@
+import os
 import sys
 import serial
 import serial.tools.list_ports
 from typing import Optional
 from module.logger import logger
 
+# find_arduino 的記憶快取
+# comports() 在 Windows 會跑 WMI/SetupAPI 查詢 (幾十到幾百 ms)，
+# 重複建 ArduinoHID 或斷線重試時不想每次都付這個錢
+_cache = {'fingerprint': None, 'port': None}
+
 
 class PortDetector:
+    @staticmethod
+    def _usb_fingerprint():
+        """
+        便宜的 USB 拓樸指紋，拿來判斷快取是否還有效
+
+        Linux: /dev 下的 ttyUSB*/ttyACM* 清單 (一次 listdir)。
+        其他平台沒有便宜的來源，回傳固定值 →
+        快取一直有效，直到 invalidate_cache() 被呼叫 (例如開 port 失敗時)。
+        """
+        if sys.platform.startswith('linux'):
+            try:
+                return tuple(sorted(
+                    name for name in os.listdir('/dev')
+                    if name.startswith(('ttyUSB', 'ttyACM'))))
+            except OSError:
+                return None
+        return 'static'
+
+    @staticmethod
+    def invalidate_cache():
+        """清掉 find_arduino 的快取 (裝置拔插、開 port 失敗時呼叫)"""
+        _cache['fingerprint'] = None
+        _cache['port'] = None
+
     @staticmethod
     def dump_all_serials(dump=False):
         ports = serial.tools.list_ports.comports()
@@ -25,6 +55,104 @@ class PortDetector:
             logger.info("")
         return ports
 
+    @staticmethod
+    def _fast_find_arduino_linux() -> Optional[str]:
+        """
+        Linux 快速路徑: 直接掃 /sys 找 VID 0x2341 (Arduino Official)
+
+        只讀每個 USB 裝置的 idVendor 再往下找 tty 子節點，
+        比 comports() 的完整 metadata 列舉便宜一個量級。
+        """
+        import glob
+        for vid_path in glob.glob('/sys/bus/usb/devices/*/idVendor'):
+            try:
+                with open(vid_path) as f:
+                    if f.read().strip() != '2341':
+                        continue
+            except OSError:
+                continue
+
+            usb_dir = os.path.dirname(vid_path)
+            # tty 節點掛在 <裝置>:<config.iface>/tty* 或再下一層 tty/ttyACMx
+            for tty_path in glob.glob(os.path.join(usb_dir, '*/tty*')):
+                name = os.path.basename(tty_path)
+                if name == 'tty':
+                    try:
+                        inner = os.listdir(tty_path)
+                    except OSError:
+                        continue
+                    if not inner:
+                        continue
+                    name = inner[0]
+                return f"/dev/{name}"
+        return None
+
+    @staticmethod
+    def _live_com_ports_windows() -> Optional[set]:
+        """
+        讀 HKLM\\HARDWARE\\DEVICEMAP\\SERIALCOMM 拿「目前真的存在」的 COM port
+
+        Enum\\USB 底下的 PortName 是歷史紀錄，拔掉的板子也留著；
+        SERIALCOMM 只列活著的。讀不到回傳 None (呼叫端自行決定要不要信)。
+        """
+        try:
+            import winreg
+        except ImportError:
+            return None
+
+        try:
+            live = set()
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                                r'HARDWARE\DEVICEMAP\SERIALCOMM') as key:
+                for i in range(winreg.QueryInfoKey(key)[1]):
+                    _name, value, _type = winreg.EnumValue(key, i)
+                    live.add(value)
+            return live
+        except OSError:
+            return None
+
+    @staticmethod
+    def _fast_find_arduino_windows() -> Optional[str]:
+        """
+        Windows 快速路徑: 讀 registry 的 Enum\\USB\\VID_2341* 取 PortName
+
+        不經過 comports() 的 WMI/SetupAPI 完整列舉。
+        候選 port 會先跟 SERIALCOMM 對一次，過濾掉已拔除裝置的殘留紀錄。
+        """
+        try:
+            import winreg
+        except ImportError:
+            return None
+
+        live_ports = PortDetector._live_com_ports_windows()
+
+        try:
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                                r'SYSTEM\CurrentControlSet\Enum\USB') as usb_key:
+                for i in range(winreg.QueryInfoKey(usb_key)[0]):
+                    dev_name = winreg.EnumKey(usb_key, i)
+                    if not dev_name.startswith('VID_2341'):
+                        continue
+                    with winreg.OpenKey(usb_key, dev_name) as dev_key:
+                        for j in range(winreg.QueryInfoKey(dev_key)[0]):
+                            instance = winreg.EnumKey(dev_key, j)
+                            try:
+                                with winreg.OpenKey(
+                                        dev_key,
+                                        instance + r'\Device Parameters') as param_key:
+                                    port, _ = winreg.QueryValueEx(param_key, 'PortName')
+                                    if not port:
+                                        continue
+                                    if live_ports is not None and port not in live_ports:
+                                        # 拔掉的板子留下的殘影，跳過
+                                        continue
+                                    return port
+                            except OSError:
+                                continue
+        except OSError:
+            pass
+        return None
+
     @staticmethod
     def find_arduino(dump=False) -> Optional[str]:
         """
@@ -34,6 +162,26 @@ class PortDetector:
             Found COM Port name，if not found return None
         """
 
+        fingerprint = PortDetector._usb_fingerprint()
+        if _cache['port'] is not None and _cache['fingerprint'] == fingerprint:
+            logger.debug(f"find_arduino cache hit: {_cache['port']}")
+            return _cache['port']
+
+        # 先試平台的快速路徑 (不用跑 comports() 的完整列舉)
+        if not dump:
+            if sys.platform.startswith('linux'):
+                fast_port = PortDetector._fast_find_arduino_linux()
+            elif sys.platform == 'win32':
+                fast_port = PortDetector._fast_find_arduino_windows()
+            else:
+                fast_port = None
+
+            if fast_port:
+                logger.info(f"  ✓ Found Arduino (fast path): {fast_port}")
+                _cache['fingerprint'] = fingerprint
+                _cache['port'] = fast_port
+                return fast_port
+
         ports = PortDetector.dump_all_serials(dump=dump)
 
         # Common Arduino VID:PID
@@ -53,10 +201,14 @@ class PortDetector:
                         if pid is None or port.pid == pid:
                             logger.info("  pid/vid:", port.pid, "/", port.vid)
                             logger.info(f"  ✓ Found Arduino: {port.device} - {port.description}")
+                            _cache['fingerprint'] = fingerprint
+                            _cache['port'] = port.device
                             return port.device
 
             if port.description and 'Arduino' in port.description:
                 logger.info(f"  ✓ Found Arduino (Desc matched): {port.device} - {port.description}")
+                _cache['fingerprint'] = fingerprint
+                _cache['port'] = port.device
                 return port.device
         return None
 
@@ -0,0 +1,47 @@
+import ctypes
+import sys
+from pathlib import Path
+
+_NATIVE_DIR = Path(__file__).parent / 'native'
+
+
+def _load():
+    """
+    載入 slice-by-4 的 C 版 CRC-8/MAXIM (module/native/crc8_maxim.c)
+
+    共享庫要先自己編好放在 native/ 目錄 (編譯指令見 .c 檔開頭)，
+    沒編譯或載入失敗就回傳 None，呼叫端自行 fallback 純 Python 版。
+    """
+    suffix = '.dll' if sys.platform == 'win32' else '.so'
+    lib_path = _NATIVE_DIR / f'crc8_maxim{suffix}'
+    if not lib_path.exists():
+        return None
+
+    try:
+        lib = ctypes.CDLL(str(lib_path))
+    except OSError:
+        return None
+
+    lib.crc8_maxim.argtypes = (ctypes.c_char_p, ctypes.c_size_t)
+    lib.crc8_maxim.restype = ctypes.c_uint8
+    return lib
+
+
+_lib = _load()
+
+if _lib is not None:
+    def crc8_maxim(data) -> int:
+        """C 版 CRC-8/MAXIM (data: bytes-like)"""
+        data = bytes(data)
+        return _lib.crc8_maxim(data, len(data))
+else:
+    crc8_maxim = None  # 共享庫不存在
+
+
+if __name__ == "__main__":
+    # Run:
+    #     python -m module.crc8_native
+    if crc8_maxim is None:
+        print("crc8_maxim 共享庫未編譯 (見 module/native/crc8_maxim.c)")
+    else:
+        print(f"crc8_maxim(b'123456789') = 0x{crc8_maxim(b'123456789'):02X}  (expect 0xA1)")
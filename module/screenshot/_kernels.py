@@ -0,0 +1,48 @@
+"""
+screenshot 熱路徑的 numba kernel (選配)
+
+沒裝 numba 時 bgra_to_rgb 為 None，呼叫端自行 fallback numpy 切片版。
+
+簽名寫死 + cache=True: 裝飾時就編譯並落地 __pycache__/*.nbc，
+之後的 process 只付載入成本，第一次 capture 不會卡在 JIT。
+"""
+
+try:
+    from numba import njit, prange, types
+except ImportError:
+    bgra_to_rgb = None
+else:
+    @njit(types.void(types.uint8[::1], types.uint8[::1], types.int64),
+          parallel=True, cache=True, fastmath=True, boundscheck=False)
+    def bgra_to_rgb(src, dst, n_pixels):
+        """BGRA flat buffer (4*n) → RGB flat buffer (3*n)
+
+        prange 跨核心平行、繞過 GIL，4K 一張的 swizzle
+        從 Python byte 迴圈等級壓到接近 memcpy。
+        """
+        for i in prange(n_pixels):
+            dst[3 * i] = src[4 * i + 2]
+            dst[3 * i + 1] = src[4 * i + 1]
+            dst[3 * i + 2] = src[4 * i]
+
+
+def warmup() -> bool:
+    """
+    用迷你輸入把所有 kernel 跑一輪，讓磁碟快取/執行緒池先建好
+
+    安裝後或程式啟動時呼叫一次即可。回傳是否有 numba kernel 可用。
+    """
+    if bgra_to_rgb is None:
+        return False
+
+    import numpy as np
+    src = np.zeros(16, dtype=np.uint8)
+    dst = np.zeros(12, dtype=np.uint8)
+    bgra_to_rgb(src, dst, 4)
+    return True
+
+
+if __name__ == "__main__":
+    # Run:
+    #     python -m module.screenshot._kernels
+    print(f"numba kernels available: {warmup()}")
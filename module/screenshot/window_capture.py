@@ -1,15 +1,32 @@
 import ctypes
+import logging
 import sys
 from module.logger import logger
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from multiprocessing import shared_memory
 from pathlib import Path
 
 import pygetwindow as gw
 import mss
 import mss.tools
 
+from module.screenshot import _kernels
+
+# 選配: 有 PIL 就直接吃 mss 的 raw BGRA 出 PNG，
+# 省掉 screenshot.rgb 的整張 BGRA→RGB 轉換複製 (4K 一張幾十 MB 的 memcpy)
+try:
+    from PIL import Image as _PILImage
+except ImportError:
+    _PILImage = None
+
+# 選配: capture_array 的零複製 ndarray view 需要 numpy
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class WindowCaptureException(Exception):
     pass
@@ -27,7 +44,9 @@ class DPIDetectionError(WindowCaptureException):
     pass
 
 
-@dataclass
+# 三個資料類都上 slots + frozen (Python 3.10+):
+# slots 省記憶體也讓屬性存取快 ~20%，frozen 保證可以安心被快取/共用
+@dataclass(slots=True, frozen=True)
 class MonitorInfo:
     index: int  # Monitor index (1-based)
     name: str
@@ -63,8 +82,11 @@ class MonitorInfo:
                 f"  DPI: {self.dpi_x}x{self.dpi_y} (Scale: {self.scale_factor:.2f}x)\n"
                 f"  Pos: x={self.x}, y={self.y}")
 
+    # repr 跟 str 一樣就好，不用另外付 dataclass 自動 repr 的格式化成本
+    __repr__ = __str__
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class WindowPosition:
     left: int
     top: int
@@ -81,21 +103,27 @@ class WindowPosition:
         return self.top + self.height
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CaptureRegion:
     left: int
     top: int
     width: int
     height: int
+    # __post_init__ 先把 mss 的 dict 算好，capture 迴圈每 frame
+    # 不再重建 4-key dict (frozen 所以快取永遠正確)
+    _mss_dict: Dict[str, int] = field(init=False, repr=False, compare=False)
 
-    def to_mss_monitor(self) -> Dict[str, int]:
-        """ Transfer to mss's Monitor dict format. """
-        return {
+    def __post_init__(self):
+        object.__setattr__(self, '_mss_dict', {
             'left': self.left,
             'top': self.top,
             'width': self.width,
             'height': self.height
-        }
+        })
+
+    def to_mss_monitor(self) -> Dict[str, int]:
+        """ Transfer to mss's Monitor dict format. """
+        return self._mss_dict
 
 
 # ==================== Windows API ====================
@@ -117,6 +145,23 @@ class RECT(ctypes.Structure):
         return self.bottom - self.top
 
 
+class BITMAPINFOHEADER(ctypes.Structure):
+    """Windows BITMAPINFOHEADER Strct (capture_ndarray 的 DIB 用)"""
+    _fields_ = [
+        ('biSize', ctypes.c_uint32),
+        ('biWidth', ctypes.c_long),
+        ('biHeight', ctypes.c_long),
+        ('biPlanes', ctypes.c_uint16),
+        ('biBitCount', ctypes.c_uint16),
+        ('biCompression', ctypes.c_uint32),
+        ('biSizeImage', ctypes.c_uint32),
+        ('biXPelsPerMeter', ctypes.c_long),
+        ('biYPelsPerMeter', ctypes.c_long),
+        ('biClrUsed', ctypes.c_uint32),
+        ('biClrImportant', ctypes.c_uint32)
+    ]
+
+
 class MONITORINFO(ctypes.Structure):
     """Windows MONITORINFO  Strct
     typedef struct tagMONITORINFO {
@@ -131,10 +176,193 @@ class MONITORINFO(ctypes.Structure):
         ('rcMonitor', RECT),
         ('rcWork', RECT),
         ('dwFlags', ctypes.c_ulong),
-        ('szDevice', ctypes.c_wchar * 32)
+        # 放 raw byte，c_wchar 每次讀屬性都要做 UTF-16 decode；
+        # 我們只在偵測時 decode 一次 (見 _monitor_enum_callback)
+        ('szDevice', ctypes.c_byte * 64)
     ]
 
 
+# ==================== Win32 prototypes ====================
+# import 時宣告一次 argtypes/restype，ctypes 呼叫就不用每次做參數自省；
+# 平台分支也在這裡決定好，熱路徑上不再有 try/except AttributeError
+_DEFAULT_DPI = (96, 96)
+
+if sys.platform == 'win32':
+    _user32 = ctypes.windll.user32
+    try:
+        _shcore = ctypes.windll.shcore  # Windows 8.1+
+    except OSError:
+        _shcore = None
+
+    _user32.GetMonitorInfoW.argtypes = (ctypes.c_void_p, ctypes.POINTER(MONITORINFO))
+    _user32.GetMonitorInfoW.restype = ctypes.c_int
+
+    _user32.GetWindowRect.argtypes = (ctypes.c_void_p, ctypes.POINTER(RECT))
+    _user32.GetWindowRect.restype = ctypes.c_int
+
+    _user32.IsWindow.argtypes = (ctypes.c_void_p,)
+    _user32.IsWindow.restype = ctypes.c_int
+
+    _user32.FindWindowW.argtypes = (ctypes.c_wchar_p, ctypes.c_wchar_p)
+    _user32.FindWindowW.restype = ctypes.c_void_p
+
+    _user32.GetWindowTextW.argtypes = (ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_int)
+    _user32.GetWindowTextW.restype = ctypes.c_int
+
+    _user32.GetDC.argtypes = (ctypes.c_void_p,)
+    _user32.GetDC.restype = ctypes.c_void_p
+
+    _user32.ReleaseDC.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
+    _user32.ReleaseDC.restype = ctypes.c_int
+
+    # capture_ndarray 的 BitBlt 路徑用
+    _gdi32 = ctypes.windll.gdi32
+    _gdi32.CreateCompatibleDC.argtypes = (ctypes.c_void_p,)
+    _gdi32.CreateCompatibleDC.restype = ctypes.c_void_p
+    _gdi32.CreateDIBSection.argtypes = (
+        ctypes.c_void_p, ctypes.POINTER(BITMAPINFOHEADER), ctypes.c_uint,
+        ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_uint32)
+    _gdi32.CreateDIBSection.restype = ctypes.c_void_p
+    _gdi32.SelectObject.argtypes = (ctypes.c_void_p, ctypes.c_void_p)
+    _gdi32.SelectObject.restype = ctypes.c_void_p
+    _gdi32.BitBlt.argtypes = (
+        ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+        ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_uint32)
+    _gdi32.BitBlt.restype = ctypes.c_int
+    _gdi32.DeleteObject.argtypes = (ctypes.c_void_p,)
+    _gdi32.DeleteObject.restype = ctypes.c_int
+    _gdi32.DeleteDC.argtypes = (ctypes.c_void_p,)
+    _gdi32.DeleteDC.restype = ctypes.c_int
+
+    # EnumDisplayMonitors 的 callback: prototype / trampoline 都只建一次，
+    # 重新偵測螢幕時不再 allocate 新的 WINFUNCTYPE 蹦床
+    _MONITOR_ENUM_PROC = ctypes.WINFUNCTYPE(
+        ctypes.c_int,
+        ctypes.c_ulong,
+        ctypes.c_ulong,
+        ctypes.POINTER(RECT),
+        ctypes.c_double
+    )
+
+    _user32.EnumDisplayMonitors.argtypes = (
+        ctypes.c_void_p, ctypes.c_void_p, _MONITOR_ENUM_PROC, ctypes.c_double)
+    _user32.EnumDisplayMonitors.restype = ctypes.c_int
+
+    # callback 寫進共用 buffer，_detect_monitors 呼叫前清空、結束後取走
+    _monitor_scan_buf: List[MonitorInfo] = []
+
+    def _monitor_enum_callback(hmonitor, hdc, lprect, lparam):
+        info = MONITORINFO()
+        info.cbSize = ctypes.sizeof(MONITORINFO)
+
+        if _user32.GetMonitorInfoW(hmonitor, ctypes.byref(info)):
+            rect = info.rcMonitor
+            dpi_x, dpi_y = _get_dpi_impl(hmonitor)
+
+            # UTF-16LE decode 一次，之後 MonitorInfo.name 就是普通 str
+            name = bytes(info.szDevice).decode('utf-16-le').rstrip('\x00')
+
+            _monitor_scan_buf.append(MonitorInfo(
+                index=len(_monitor_scan_buf) + 1,
+                name=name,
+                width=rect.width,
+                height=rect.height,
+                x=rect.left,
+                y=rect.top,
+                dpi_x=dpi_x,
+                dpi_y=dpi_y,
+                scale_factor=DPIManager.calculate_scale_factor(dpi_x),
+                is_primary=bool(info.dwFlags & 1)  # MONITORINFOF_PRIMARY = 1
+            ))
+
+        return True  # Continue enumeration
+
+    _monitor_enum_proc_instance = _MONITOR_ENUM_PROC(_monitor_enum_callback)
+
+    # set_dpi_awareness 的 API 也在 import 時挑好，
+    # 呼叫端不用每次 try/except AttributeError 探測
+    if _shcore is not None and hasattr(_shcore, 'SetProcessDpiAwareness'):
+        _set_dpi = _shcore.SetProcessDpiAwareness  # Windows 8.1+
+        _set_dpi.argtypes = (ctypes.c_int,)
+        _set_dpi.restype = ctypes.c_long
+        _set_dpi_takes_mode = True
+    else:
+        _set_dpi = _user32.SetProcessDPIAware  # Windows Vista+
+        _set_dpi.argtypes = ()
+        _set_dpi.restype = ctypes.c_int
+        _set_dpi_takes_mode = False
+
+    if _shcore is not None:
+        _shcore.GetDpiForMonitor.argtypes = (
+            ctypes.c_void_p, ctypes.c_int,
+            ctypes.POINTER(ctypes.c_uint), ctypes.POINTER(ctypes.c_uint))
+        _shcore.GetDpiForMonitor.restype = ctypes.c_long
+
+        def _get_dpi_impl(hmonitor) -> Tuple[int, int]:
+            dpi_x = ctypes.c_uint()
+            dpi_y = ctypes.c_uint()
+            result = _shcore.GetDpiForMonitor(
+                hmonitor, 0,  # MDT_EFFECTIVE_DPI
+                ctypes.byref(dpi_x), ctypes.byref(dpi_y))
+            if result == 0:  # S_OK
+                return (dpi_x.value, dpi_y.value)
+            logger.warning(f"GetDpiForMonitor return: {result}, use default DPI {_DEFAULT_DPI}")
+            return _DEFAULT_DPI
+    else:
+        def _get_dpi_impl(hmonitor) -> Tuple[int, int]:
+            return _DEFAULT_DPI
+else:
+    _user32 = None
+    _shcore = None
+    _gdi32 = None
+    _set_dpi = None
+    _set_dpi_takes_mode = False
+
+    def _get_dpi_impl(hmonitor) -> Tuple[int, int]:
+        return _DEFAULT_DPI
+
+
+class _Win32Window:
+    """
+    gw.Win32Window 的輕量替身 (find_window 的 FindWindowW 快速路徑回傳)
+
+    只暴露這個模組用得到的屬性。座標屬性跟 pygetwindow 一樣
+    每次讀都打一次 GetWindowRect — 熱路徑本來就該走快取的
+    WindowCapture._refresh_window_rect，不會碰到這些 property。
+    """
+    __slots__ = ('_hWnd',)
+
+    def __init__(self, hwnd: int):
+        self._hWnd = hwnd
+
+    def _rect(self) -> RECT:
+        rect = RECT()
+        _user32.GetWindowRect(self._hWnd, ctypes.byref(rect))
+        return rect
+
+    @property
+    def title(self) -> str:
+        buf = ctypes.create_unicode_buffer(256)
+        _user32.GetWindowTextW(self._hWnd, buf, 256)
+        return buf.value
+
+    @property
+    def left(self) -> int:
+        return self._rect().left
+
+    @property
+    def top(self) -> int:
+        return self._rect().top
+
+    @property
+    def width(self) -> int:
+        return self._rect().width
+
+    @property
+    def height(self) -> int:
+        return self._rect().height
+
+
 # ==================== DPI ====================
 class DPIAwareness(Enum):
     """ DPI Aware """
@@ -159,21 +387,19 @@ class DPIManager:
         Returns:
             True for success setting, False for failure
         """
-        try:
-            if sys.platform != 'win32':
-                logger.warning("Non-Windows, Skip DPI Setting")
-                return True
+        if _set_dpi is None:
+            logger.warning("Non-Windows, Skip DPI Setting")
+            return True
 
-            # Try Windows 10+  API
-            try:
-                ctypes.windll.shcore.SetProcessDpiAwareness(mode.value)
+        # 要打哪個 API 在 import 時就決定好了 (見 Win32 prototypes)
+        try:
+            if _set_dpi_takes_mode:
+                _set_dpi(mode.value)
                 logger.info(f"DPI Awareness setting on: {mode.name}")
-                return True
-            except AttributeError:
-                # Windows 8.1
-                ctypes.windll.user32.SetProcessDPIAware()
+            else:
+                _set_dpi()
                 logger.info("Use DPI Awareness API (Windows 8.1 Below)")
-                return True
+            return True
 
         except Exception as e:
             logger.error(f"Setting DPI Awareness failed: {e}")
@@ -190,32 +416,8 @@ class DPIManager:
         Returns:
             (dpi_x, dpi_y)
         """
-        l_DEFAULT_DPI = (96, 96)
-
-        try:
-            if sys.platform != 'win32':
-                logger.warning("Non-Windows Use DPI 96")
-                return l_DEFAULT_DPI
-
-            dpi_x = ctypes.c_uint()
-            dpi_y = ctypes.c_uint()
-
-            result = ctypes.windll.shcore.GetDpiForMonitor(
-                hmonitor,
-                DPIManager.MDT_EFFECTIVE_DPI,
-                ctypes.byref(dpi_x),
-                ctypes.byref(dpi_y)
-            )
-
-            if result == 0:  # S_OK
-                return (dpi_x.value, dpi_y.value)
-            else:
-                logger.warning(f"GetDpiForMonitor return: {result}, use default DPI {l_DEFAULT_DPI}")
-                return l_DEFAULT_DPI
-
-        except Exception as e:
-            logger.error(f"Get DPI failed: {e}")
-            return l_DEFAULT_DPI
+        # 實作在 import 時依平台/可用 API 綁定好 (_get_dpi_impl)
+        return _get_dpi_impl(hmonitor)
 
     @staticmethod
     def calculate_scale_factor(dpi: int) -> float:
@@ -237,6 +439,16 @@ class MonitorManager:
     def __init__(self):
         self.monitors: List[MonitorInfo] = []
         self._detect_monitors()
+        # 有 numpy 就把邊界攤成一張 (N, 4) 陣列，點查詢用向量化 mask
+        # 一次比完所有螢幕，省掉 N 個 MonitorInfo 的 Python 屬性存取
+        if np is not None and self.monitors:
+            self._bounds = np.array(
+                [[m.x, m.y, m.x + m.width, m.y + m.height] for m in self.monitors])
+        else:
+            self._bounds = None
+        # 上一次命中的 monitor — 重用前會先精確驗證點還在裡面
+        # (見 get_monitor_at_point_cached)
+        self._last_monitor: Optional[MonitorInfo] = None
 
     def _detect_monitors(self) -> None:
         """Detect all screens and their DPI information (using Windows API) """
@@ -248,48 +460,17 @@ class MonitorManager:
                 self._detect_monitors_mss()
                 return
 
-            def callback(hmonitor, hdc, lprect, lparam):
-                info = MONITORINFO()
-                info.cbSize = ctypes.sizeof(MONITORINFO)
-
-                if ctypes.windll.user32.GetMonitorInfoW(hmonitor, ctypes.byref(info)):
-                    rect = info.rcMonitor
-
-                    # Get DPI
-                    dpi_x, dpi_y = DPIManager.get_monitor_dpi(hmonitor)
-                    scale_factor = DPIManager.calculate_scale_factor(dpi_x)
-
-                    is_primary = bool(info.dwFlags & 1)  # MONITORINFOF_PRIMARY = 1
-
-                    monitor_info = MonitorInfo(
-                        index=len(self.monitors) + 1,
-                        name=info.szDevice,
-                        width=rect.width,
-                        height=rect.height,
-                        x=rect.left,
-                        y=rect.top,
-                        dpi_x=dpi_x,
-                        dpi_y=dpi_y,
-                        scale_factor=scale_factor,
-                        is_primary=is_primary
-                    )
-
-                    self.monitors.append(monitor_info)
-                    logger.debug(f"Detected: {monitor_info}")
-
-                return True  # Continue enumeration
-
-            MonitorEnumProc = ctypes.WINFUNCTYPE(
-                ctypes.c_int,
-                ctypes.c_ulong,
-                ctypes.c_ulong,
-                ctypes.POINTER(RECT),
-                ctypes.c_double
+            # callback / trampoline 是 import 時建好的單一實例 (見 Win32 prototypes)
+            del _monitor_scan_buf[:]
+            _user32.EnumDisplayMonitors(
+                None, None, _monitor_enum_proc_instance, 0
             )
 
-            ctypes.windll.user32.EnumDisplayMonitors(
-                None, None, MonitorEnumProc(callback), 0
-            )
+            self.monitors.extend(_monitor_scan_buf)
+            # MonitorInfo.__str__ 會組好幾段字串，debug 沒開就別做白工
+            if logger.isEnabledFor(logging.DEBUG):
+                for monitor_info in _monitor_scan_buf:
+                    logger.debug("Detected: %s", monitor_info)
 
             logger.info(f"Total Detected {len(self.monitors)} Monitors")
 
@@ -319,7 +500,8 @@ class MonitorManager:
                     )
 
                     self.monitors.append(monitor_info)
-                    logger.debug(f"Detected: {monitor_info}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Detected: %s", monitor_info)
 
             logger.info(f"A total of {len(self.monitors)} screen (no DPI information)")
 
@@ -337,14 +519,43 @@ class MonitorManager:
         Returns:
             MonitorInfo / None
         """
-        for monitor in self.monitors:
-            if (monitor.x <= x < monitor.x + monitor.width and
-                monitor.y <= y < monitor.y + monitor.height):
-                return monitor
+        if self._bounds is not None:
+            b = self._bounds
+            mask = (b[:, 0] <= x) & (x < b[:, 2]) & (b[:, 1] <= y) & (y < b[:, 3])
+            if mask.any():
+                return self.monitors[int(np.argmax(mask))]
+        else:
+            for monitor in self.monitors:
+                if (monitor.x <= x < monitor.x + monitor.width and
+                    monitor.y <= y < monitor.y + monitor.height):
+                    return monitor
 
-        logger.warning(f"Pos ({x}, {y}) not within the range of any known screen")
+        logger.warning("Pos (%d, %d) not within the range of any known screen", x, y)
         return None
 
+    def get_monitor_at_point_cached(self, x: int, y: int) -> Optional[MonitorInfo]:
+        """
+        get_monitor_at_point 的快取版 (給每 frame 都要查的 capture 迴圈用)
+
+        視窗幾乎都待在同一顆螢幕: 先精確驗證上一次的答案
+        還包含 (x, y)，是就直接重用，不是才走完整查詢 —
+        螢幕交界附近也不會回錯顆。
+        """
+        monitor = self._last_monitor
+        if (monitor is not None and
+                monitor.x <= x < monitor.x + monitor.width and
+                monitor.y <= y < monitor.y + monitor.height):
+            return monitor
+
+        monitor = self.get_monitor_at_point(x, y)
+        if monitor is not None:
+            self._last_monitor = monitor
+        return monitor
+
+    def invalidate(self) -> None:
+        """清掉 monitor 查詢快取 (螢幕配置變動時呼叫)"""
+        self._last_monitor = None
+
     def get_primary_monitor(self) -> MonitorInfo:
         for monitor in self.monitors:
             if monitor.is_primary:
@@ -394,17 +605,46 @@ class WindowCapture:
     # Viewport coordinate anomaly threshold.
     COORDINATE_THRESHOLD = 10000
 
-    def __init__(self, window_title: str = "MapleStory", auto_init_dpi: bool = True):
+    def __init__(self, window_title: str = "MapleStory", auto_init_dpi: bool = True,
+                 png_compress_level: int = 1, verbose: bool = True):
         """
 
         Args:
             window_title: target window title
             auto_init_dpi:
+            png_compress_level: PNG 壓縮等級 0~9 (預設 1:
+                zlib 預設的 6 在大畫面會讓 DEFLATE 吃掉大半 capture 時間，
+                暫存用截圖換檔案大一點沒差)
+            verbose: 串流抓圖時給 False，每 frame 的 info log
+                (格式化 + logging lock) 全部跳過；error/warning 不受影響
         """
         self.window_title = window_title
+        self.png_compress_level = png_compress_level
+        self.verbose = verbose
         self.window: Optional[gw.Win32Window] = None
         self.monitor_manager: Optional[MonitorManager] = None
 
+        # capture 迴圈的快取: 視窗 rect 沒變就直接重用算好的 CaptureRegion
+        self._region_cache: Dict[Tuple, CaptureRegion] = {}
+        self._last_rect: Optional[Tuple[int, int, int, int]] = None
+
+        # 找到視窗後記住 HWND，之後拿座標直接打 GetWindowRect
+        self._hwnd: Optional[int] = None
+
+        # 跨 capture 重用的 mss 實例 (延遲建立，見 _get_sct)
+        self._sct: Optional[mss.base.MSSBase] = None
+
+        # capture_ndarray 的 DIB 資源 (同尺寸 region 重用，見 _ensure_dib)
+        self._dib_handles: Optional[Tuple] = None  # (srcdc, memdc, hbmp)
+        self._dib_size: Optional[Tuple[int, int]] = None
+        self._dib_array = None  # DIB 記憶體上的 ndarray view
+
+        # _bgra_to_rgb 的輸出緩衝 (同尺寸重用，不每 frame 配置)
+        self._rgb_buf = None
+
+        # capture_shm 的共享記憶體區塊 (配一次，跨 frame 重用)
+        self._shm: Optional[shared_memory.SharedMemory] = None
+
         if auto_init_dpi:
             self._initialize_dpi()
 
@@ -448,6 +688,19 @@ class WindowCapture:
         """
         search_title = title or self.window_title
 
+        # Win32 快速路徑: FindWindowW 在 kernel 內找「完全同名」的頂層視窗，
+        # 一個 syscall 搞定，不用 pygetwindow 的 EnumWindows 全掃 +
+        # 每個 hwnd 各打一次 GetWindowText
+        if _user32 is not None:
+            hwnd = _user32.FindWindowW(None, search_title)
+            if hwnd:
+                self.window = _Win32Window(hwnd)
+                self._hwnd = hwnd
+                logger.info(f"Found window: '{self.window.title}'")
+                self.invalidate_cache()  # 換了視窗，舊的 region 快取不能用
+                return True
+            # 沒有完全同名的 → 往下走 pygetwindow (它做的是子字串比對)
+
         try:
             windows = gw.getWindowsWithTitle(search_title)
 
@@ -457,7 +710,9 @@ class WindowCapture:
                 raise WindowNotFoundError(f"Not found window named: '{search_title}'")
 
             self.window = windows[0]
+            self._hwnd = getattr(self.window, '_hWnd', None)
             logger.info(f"Found window: '{self.window.title}'")
+            self.invalidate_cache()  # 換了視窗，舊的 region 快取不能用
             return True
 
         except IndexError:
@@ -465,12 +720,43 @@ class WindowCapture:
             self._print_available_windows()
             raise WindowNotFoundError(f"Not found window name: '{search_title}'")
 
+    def invalidate_cache(self) -> None:
+        """清掉 region 快取 (換視窗、視窗移動時呼叫)"""
+        self._region_cache.clear()
+        self._last_rect = None
+        if self.monitor_manager is not None:
+            self.monitor_manager.invalidate()
+
     def _print_available_windows(self) -> None:
         logger.info("List all available windows:")
         for title in self.list_available_windows():
             logger.info(f"  - {title}")
         logger.info()
 
+    def _refresh_window_rect(self) -> Optional[WindowPosition]:
+        """
+        HWND 快速路徑: 一次 GetWindowRect 拿座標
+
+        不經過 pygetwindow (它每個 .top/.left/.width/.height 屬性
+        都各打一次 Win32)。HWND 失效或非 Windows 回傳 None，呼叫端 fallback。
+        """
+        if self._hwnd is None or _user32 is None:
+            return None
+        if not _user32.IsWindow(self._hwnd):
+            return None
+
+        rect = RECT()
+        if not _user32.GetWindowRect(self._hwnd, ctypes.byref(rect)):
+            return None
+
+        return WindowPosition(
+            left=rect.left,
+            top=rect.top,
+            width=rect.width,
+            height=rect.height,
+            title=self.window.title if self.window else self.window_title
+        )
+
     def get_window_position(self) -> WindowPosition:
         """
         Logic coordinate of the target window
@@ -481,26 +767,45 @@ class WindowCapture:
         if self.window is None:
             raise WindowNotFoundError("Call find_window() first.")
 
-        if (abs(self.window.top) > self.COORDINATE_THRESHOLD or
-            abs(self.window.left) > self.COORDINATE_THRESHOLD):
+        position = self._refresh_window_rect()
+        if position is None:
+            if self._hwnd is not None and _user32 is not None:
+                # HWND 失效 (視窗關掉重開?) → 重新走完整搜尋
+                logger.warning("Cached HWND invalid, re-run find_window()")
+                self.find_window()
+                position = self._refresh_window_rect()
+
+            if position is None:
+                # pygetwindow fallback (非 Windows 或 HWND 拿不到)
+                position = WindowPosition(
+                    left=self.window.left,
+                    top=self.window.top,
+                    width=self.window.width,
+                    height=self.window.height,
+                    title=self.window.title
+                )
+
+        # 門檻檢查: 座標先收進 local，比較走 chained range
+        # (位元遮罩那種 branchless 捷徑不能用 — 多螢幕的負座標
+        #  是合法的，例如左側螢幕 x=-1920，sign bit 會被誤殺)
+        left = position.left
+        top = position.top
+        threshold = self.COORDINATE_THRESHOLD
+        if not (-threshold <= left <= threshold and
+                -threshold <= top <= threshold):
             error_msg = (
-                f"Window '{self.window.title}' abnormal, not in frontend\n"
-                f"  Pos: x={self.window.left}, y={self.window.top}\n"
+                f"Window '{position.title}' abnormal, not in frontend\n"
+                f"  Pos: x={left}, y={top}\n"
                 f"  Please check if the window is minimized or obscured."
             )
             logger.error(error_msg)
             raise WindowNotForegroundError(error_msg)
 
-        position = WindowPosition(
-            left=self.window.left,
-            top=self.window.top,
-            width=self.window.width,
-            height=self.window.height,
-            title=self.window.title
-        )
-
-        logger.info(f"Win pos: x={position.left}, y={position.top}, "
-                   f"w={position.width}, h={position.height}")
+        # 每 frame 都會走到的 log 一律用 lazy %-formatting，
+        # level 沒開就不付字串格式化的成本
+        if self.verbose:
+            logger.info("Win pos: x=%d, y=%d, w=%d, h=%d",
+                        left, top, position.width, position.height)
 
         return position
 
@@ -520,9 +825,21 @@ class WindowCapture:
         if position is None:
             position = self.get_window_position()
 
+        # 視窗沒動就不用重查螢幕/DPI — 這些都是昂貴的 ctypes 來回
+        rect = (position.left, position.top, position.width, position.height)
+        if rect != self._last_rect:
+            self.invalidate_cache()
+            self._last_rect = rect
+
+        key = rect + (use_manual_scale,)
+        cached = self._region_cache.get(key)
+        if cached is not None:
+            return cached
+
         if use_manual_scale is not None:
             scale = use_manual_scale
-            logger.info(f"Use manual scaling: {scale:.2f}x")
+            if self.verbose:
+                logger.info("Use manual scaling: %.2fx", scale)
         else:
             if self.monitor_manager is None:
                 logger.warning("MonitorManager is not initialized; use the default scaling of 1.0x.")
@@ -532,28 +849,300 @@ class WindowCapture:
                 center_x = position.left + position.width // 2
                 center_y = position.top + position.height // 2
 
-                monitor = self.monitor_manager.get_monitor_at_point(center_x, center_y)
+                monitor = self.monitor_manager.get_monitor_at_point_cached(center_x, center_y)
 
                 if monitor:
                     scale = monitor.scale_factor
-                    logger.info(f"The viewport is located at {monitor.name}, DPI scaling is: {scale:.2f}x")
+                    if self.verbose:
+                        logger.info("The viewport is located at %s, DPI scaling is: %.2fx",
+                                    monitor.name, scale)
                 else:
                     scale = 1.0
                     logger.warning("Unable to determine the screen size of the window, using the default scaling 1.0x")
 
-        region = CaptureRegion(
-            left=int(position.left * scale),
-            top=int(position.top * scale),
-            width=int(position.width * scale),
-            height=int(position.height * scale)
-        )
+        if scale == 1.0:
+            # 沒有 HiDPI 縮放 (最常見): region 就是視窗 rect 本身，
+            # 4 次 int(x * scale) 的 float 往返直接省掉
+            region = CaptureRegion(
+                left=position.left,
+                top=position.top,
+                width=position.width,
+                height=position.height
+            )
+        else:
+            region = CaptureRegion(
+                left=int(position.left * scale),
+                top=int(position.top * scale),
+                width=int(position.width * scale),
+                height=int(position.height * scale)
+            )
 
-        logger.info(f"Screenshot area (entity pixels): "
-                   f"left={region.left}, top={region.top}, "
-                   f"width={region.width}, height={region.height}")
+        if self.verbose:
+            logger.info("Screenshot area (entity pixels): "
+                        "left=%d, top=%d, width=%d, height=%d",
+                        region.left, region.top, region.width, region.height)
 
+        self._region_cache[key] = region
         return region
 
+    def _get_sct(self):
+        """
+        延遲建立、跨 capture 重用的 mss 實例
+
+        每次 with mss.mss() 在 Windows 都會重建 memory DC / DIB section，
+        穩態同尺寸抓圖重用同一個實例可省掉這些 Win32 setup。
+        """
+        if self._sct is None:
+            self._sct = mss.mss()
+        return self._sct
+
+    def _release_dib(self) -> None:
+        """釋放 capture_ndarray 的 GDI 資源"""
+        if self._dib_handles is not None:
+            srcdc, memdc, hbmp = self._dib_handles
+            # 先砍 DC 再砍 bitmap: bitmap 還被 select 在 DC 上時
+            # DeleteObject 會靜默失敗，整張 DIB 就漏掉了
+            _gdi32.DeleteDC(memdc)
+            _gdi32.DeleteObject(hbmp)
+            _user32.ReleaseDC(None, srcdc)
+            self._dib_handles = None
+        self._dib_size = None
+        self._dib_array = None
+
+    def _ensure_dib(self, width: int, height: int) -> None:
+        """
+        準備 (或重用) capture_ndarray 要 BitBlt 進去的 DIB section
+
+        同尺寸只建一次: CreateDIBSection + ndarray view 都是 setup 成本，
+        穩態迴圈裡只剩 BitBlt 本身。
+        """
+        if self._dib_size == (width, height):
+            return
+        self._release_dib()
+
+        srcdc = _user32.GetDC(None)
+        memdc = _gdi32.CreateCompatibleDC(srcdc)
+
+        bmi = BITMAPINFOHEADER()
+        bmi.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        bmi.biWidth = width
+        bmi.biHeight = -height  # 負值 = top-down，掃描線順序跟 ndarray 一致
+        bmi.biPlanes = 1
+        bmi.biBitCount = 32
+        bmi.biCompression = 0  # BI_RGB
+
+        bits = ctypes.c_void_p()
+        hbmp = _gdi32.CreateDIBSection(
+            srcdc, ctypes.byref(bmi), 0,  # DIB_RGB_COLORS
+            ctypes.byref(bits), None, 0)
+        if not hbmp:
+            _gdi32.DeleteDC(memdc)
+            _user32.ReleaseDC(None, srcdc)
+            raise WindowCaptureException("CreateDIBSection failed")
+
+        _gdi32.SelectObject(memdc, hbmp)
+
+        buf = (ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)
+        self._dib_handles = (srcdc, memdc, hbmp)
+        self._dib_size = (width, height)
+        self._dib_array = np.frombuffer(buf, dtype=np.uint8).reshape(height, width, 4)
+
+    def capture_ndarray(self, region: Optional[CaptureRegion] = None,
+                        manual_scale: Optional[float] = None):
+        """
+        抓 region 回傳 (H, W, 4) BGRA ndarray — 熱迴圈專用
+
+        Windows 直接 BitBlt 進重用的 DIB section，回傳的是 DIB 記憶體的
+        view (零複製，下一次呼叫會覆寫，要留著請自己 .copy())。
+        非 Windows 退回 mss grab (多一次緩衝複製)。
+
+        Returns:
+            np.ndarray (uint8, H x W x 4, BGRA)
+        """
+        if np is None:
+            raise WindowCaptureException("capture_ndarray 需要 numpy")
+
+        if region is None:
+            if self.window is None:
+                self.find_window()
+            region = self.calculate_capture_region(use_manual_scale=manual_scale)
+
+        if _gdi32 is None:
+            screenshot = self._get_sct().grab(region.to_mss_monitor())
+            return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+                screenshot.height, screenshot.width, 4)
+
+        self._ensure_dib(region.width, region.height)
+        srcdc, memdc, _hbmp = self._dib_handles
+        SRCCOPY = 0x00CC0020
+        if not _gdi32.BitBlt(memdc, 0, 0, region.width, region.height,
+                             srcdc, region.left, region.top, SRCCOPY):
+            raise WindowCaptureException("BitBlt failed")
+        return self._dib_array
+
+    def close(self) -> None:
+        """釋放持有的 mss 實例、GDI 資源與共享記憶體"""
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+        if _gdi32 is not None:
+            self._release_dib()
+        if self._shm is not None:
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass  # 別的端先清掉了
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _write_png(screenshot, output_path, compress_level: int = 1) -> None:
+        """
+        把 mss 的 ScreenShot 寫成 PNG
+
+        有 PIL 時用 frombuffer 直接讀 raw BGRX，不經過 screenshot.rgb
+        的轉換複製；沒有 PIL 就退回 mss.tools.to_png。
+        """
+        if _PILImage is not None:
+            img = _PILImage.frombuffer('RGB', screenshot.size,
+                                       screenshot.bgra, 'raw', 'BGRX')
+            img.save(output_path, 'PNG', compress_level=compress_level)
+        else:
+            mss.tools.to_png(screenshot.rgb, screenshot.size,
+                             level=compress_level, output=output_path)
+
+    def _bgra_to_rgb(self, raw):
+        """
+        BGRA raw buffer → RGB 的 flat ndarray (給只吃 RGB 的下游用)
+
+        有 numba 走 _kernels.bgra_to_rgb (prange 多核)，沒有就 numpy 切片 —
+        兩條路都比 mss 的 screenshot.rgb (Python byte 迴圈) 快得多。
+        輸出緩衝同尺寸重用，回傳值下一次呼叫會覆寫。
+        """
+        if np is None:
+            raise WindowCaptureException("_bgra_to_rgb 需要 numpy")
+
+        src = np.frombuffer(raw, dtype=np.uint8)
+        n_pixels = src.size // 4
+        if self._rgb_buf is None or self._rgb_buf.size != n_pixels * 3:
+            self._rgb_buf = np.empty(n_pixels * 3, dtype=np.uint8)
+
+        if _kernels.bgra_to_rgb is not None:
+            _kernels.bgra_to_rgb(src, self._rgb_buf, n_pixels)
+        else:
+            pix = src.reshape(-1, 4)
+            rgb = self._rgb_buf.reshape(-1, 3)
+            rgb[:, 0] = pix[:, 2]
+            rgb[:, 1] = pix[:, 1]
+            rgb[:, 2] = pix[:, 0]
+        return self._rgb_buf
+
+    @staticmethod
+    def _bgra_to_rgba_swar(buf):
+        """
+        BGRA → RGBA 就地 byte-swap (SWAR: 一個 uint32 元素 = 一個 pixel)
+
+        經典 XOR 交換 byte0(B) / byte2(R):
+            t = (x ^ (x >> 16)) & 0xFF
+            x ^= t | (t << 16)
+        NumPy 位元運算走向量化 SIMD，branchless、不需額外輸出緩衝 —
+        numba kernel 編不了時給 RGBA 下游的免編譯替代。
+
+        Args:
+            buf: flat / C-contiguous 的 uint8 BGRA ndarray (長度為 4 的倍數)
+
+        Returns:
+            同一個 buf (已就地變成 RGBA)
+        """
+        if np is None:
+            raise WindowCaptureException("_bgra_to_rgba_swar 需要 numpy")
+
+        u32 = buf.reshape(-1).view(np.uint32)
+        t = (u32 ^ (u32 >> np.uint32(16))) & np.uint32(0xFF)
+        u32 ^= t | (t << np.uint32(16))
+        return buf
+
+    def capture_array(self, manual_scale: Optional[float] = None):
+        """
+        抓視窗畫面，回傳 (H, W, 4) BGRA 的 np.ndarray
+
+        回傳值是 raw buffer 的 view (零複製)，給 CV 流水線用:
+        不落地 PNG、不做 BGRA→RGB 轉換。
+
+        Returns:
+            np.ndarray (uint8, H x W x 4)
+        """
+        if np is None:
+            raise WindowCaptureException("capture_array 需要 numpy")
+
+        if self.window is None:
+            self.find_window()
+
+        region = self.calculate_capture_region(use_manual_scale=manual_scale)
+
+        screenshot = self._get_sct().grab(region.to_mss_monitor())
+
+        return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+            screenshot.height, screenshot.width, 4)
+
+    def capture_shm(self, name: str = 'msfk_frame',
+                    region: Optional[CaptureRegion] = None) -> Tuple[str, Tuple[int, int, int]]:
+        """
+        抓一張進共享記憶體，給別的 process 的 CV 流水線零複製讀取
+
+        不落地 PNG: 省掉每 frame 的 DEFLATE 編碼 + 磁碟 I/O +
+        消費端 imread() 的解碼往返。區塊配一次跨 frame 重用，消費端:
+
+            shm = shared_memory.SharedMemory(name='msfk_frame')
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)  # BGRA
+
+        Args:
+            name: 共享記憶體區塊名稱
+            region: 抓取區域，None 則自動算視窗區域
+
+        Returns:
+            (共享記憶體名稱, shape 即 (H, W, 4))
+        """
+        if np is None:
+            raise WindowCaptureException("capture_shm 需要 numpy")
+
+        if region is None:
+            if self.window is None:
+                self.find_window()
+            region = self.calculate_capture_region()
+
+        shape = (region.height, region.width, 4)
+        nbytes = region.height * region.width * 4
+
+        if self._shm is not None and self._shm.size < nbytes:
+            # 視窗變大了，舊區塊不夠裝 → 換一塊
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+        if self._shm is None:
+            try:
+                self._shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes)
+            except FileExistsError:
+                # 上次沒清乾淨的殘留區塊，夠大就直接沿用
+                self._shm = shared_memory.SharedMemory(name=name)
+                if self._shm.size < nbytes:
+                    self._shm.close()
+                    self._shm.unlink()
+                    self._shm = shared_memory.SharedMemory(name=name, create=True, size=nbytes)
+
+        dst = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf)
+        # BitBlt 進重用的 DIB 後 memcpy 進共享區塊
+        # (CreateDIBSection 的像素記憶體是它自己的，沒辦法直接指到 shm)
+        dst[:] = self.capture_ndarray(region)
+        return (self._shm.name, shape)
+
     def capture(self,
                 output_path: str = "screenshot.png",
                 manual_scale: Optional[float] = None) -> str:
@@ -567,7 +1156,8 @@ class WindowCapture:
         Returns:
             Output file path
         """
-        logger.info(f"Start taking screenshots and outputting the path.: {output_path}")
+        if self.verbose:
+            logger.info("Start taking screenshots and outputting the path.: %s", output_path)
 
         if self.window is None:
             self.find_window()
@@ -576,11 +1166,11 @@ class WindowCapture:
         region = self.calculate_capture_region(use_manual_scale=manual_scale)
 
         try:
-            with mss.mss() as sct:
-                screenshot = sct.grab(region.to_mss_monitor())
-                mss.tools.to_png(screenshot.rgb, screenshot.size, output=output_path)
+            screenshot = self._get_sct().grab(region.to_mss_monitor())
+            self._write_png(screenshot, output_path, self.png_compress_level)
 
-            logger.info(f"Screenshot successful: {output_path}")
+            if self.verbose:
+                logger.info("Screenshot successful: %s", output_path)
             return output_path
 
         except Exception as e:
@@ -617,10 +1207,10 @@ class WindowCapture:
         logger.info(f"Capture screen {monitor_index}: {monitor.name}")
 
         try:
-            with mss.mss() as sct:
-                # The monitors index in MSS starts from 1.
-                screenshot = sct.grab(sct.monitors[monitor_index])
-                mss.tools.to_png(screenshot.rgb, screenshot.size, output=output_path)
+            sct = self._get_sct()
+            # The monitors index in MSS starts from 1.
+            screenshot = sct.grab(sct.monitors[monitor_index])
+            self._write_png(screenshot, output_path, self.png_compress_level)
 
             logger.info(f"Screenshot successful: {output_path}")
             return output_path